@@ -51,16 +51,13 @@ class Artist(BaseModel, ApiMixin):
 
     @classmethod
     def from_dict(cls, data: Dict):
-        try:
-            data.update(data.pop("stats"))
-        except KeyError:
-            pass
-
-        try:
-            correction = data.pop("correction")
-            data = correction.pop("artist")
-        except KeyError:
-            pass
+        stats = data.pop("stats", None)
+        if stats:
+            data.update(stats)
+
+        correction = data.pop("correction", None)
+        if correction and "artist" in correction:
+            data = correction["artist"]
 
         if "name" not in data and "text" in data:
             data["name"] = data.pop("text")
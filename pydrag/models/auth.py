@@ -76,4 +76,7 @@ class AuthToken(BaseModel, ApiMixin):
         :rtype: :class:`~pydrag.models.auth.AuthToken`
         """
 
-        return cls.retrieve(bind=AuthToken, params={"method": "auth.getToken"})
+        # Tokens are single use, never serve them from the cache
+        return cls.retrieve(
+            bind=AuthToken, params={"method": "auth.getToken"}, cache=False
+        )
@@ -1,10 +1,13 @@
+import heapq
 import os
 import time
-from collections import UserList
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
-from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -21,6 +24,18 @@ from pydrag.utils import to_camel_case
 T = TypeVar("T", bound="BaseModel")
 
 
+primitives: Dict[Any, type] = {
+    str: str,
+    Optional[str]: str,
+    int: int,
+    Optional[int]: int,
+    float: float,
+    Optional[float]: float,
+    bool: bool,
+    Optional[bool]: bool,
+}
+
+
 class BaseModel:
     """
     Pydrag Base Model.
@@ -28,6 +43,8 @@ class BaseModel:
     :param params: The params used to fetch the api response data
     """
 
+    __slots__ = ()
+
     params: Union[List, Dict, None] = attrib(init=False, default=None)
 
     def to_dict(self) -> Dict:
@@ -38,9 +55,31 @@ class BaseModel:
 
         :rtype: Dict
         """
-        return asdict(
-            self, filter=lambda f, v: v is not None and not isinstance(v, dict)
-        )
+        cls = type(self)
+        func = cls.__dict__.get("_to_dict")
+        if func is None:
+            func = compile_to_dict(cls)
+            cls._to_dict = func  # type: ignore
+        return func(self)
+
+    @classmethod
+    def primitive_fields(cls) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Return the str, int, float and bool field names of the class. The
+        groups are built once per class on first use, attrs decorates the
+        classes after their creation so we can't do this any earlier.
+
+        :rtype: Tuple[Tuple[str, ...], ...]
+        """
+        result = cls.__dict__.get("_primitive_fields")
+        if result is None:
+            types = [(f.name, primitives.get(f.type)) for f in fields(cls)]
+            result = tuple(
+                tuple(name for name, tp in types if tp is primitive)
+                for primitive in (str, int, float, bool)
+            )
+            cls._primitive_fields = result  # type: ignore
+        return result
 
     @classmethod
     def from_dict(cls: Type, data: Dict) -> "BaseModel":
@@ -52,27 +91,94 @@ class BaseModel:
         :type data: Type[BaseModel]
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
-        for f in fields(cls):
-            if f.name not in data or data[f.name] is None:
-                continue
-
-            if f.type == str or f.type == Optional[str]:
-                data[f.name] = str(data[f.name])
-            elif f.type == int or f.type == Optional[int]:
+        str_fields, int_fields, float_fields, bool_fields = cls.primitive_fields()
+        for name in str_fields:
+            value = data.get(name)
+            if value is not None:
+                data[name] = str(value)
+
+        for name in int_fields:
+            value = data.get(name)
+            if value is not None:
                 try:
-                    data[f.name] = int(data[f.name])
+                    data[name] = int(value)
                 except ValueError:
-                    data[f.name] = 0
-            elif f.type == float or f.type == Optional[float]:
-                data[f.name] = float(data[f.name])
-            elif f.type == bool or f.type == Optional[bool]:
-                data[f.name] = bool(int(data[f.name]))
+                    data[name] = 0
+
+        for name in float_fields:
+            value = data.get(name)
+            if value is not None:
+                data[name] = float(value)
+
+        for name in bool_fields:
+            value = data.get(name)
+            if value is not None:
+                data[name] = bool(int(value))
 
         return cls(**data)
 
 
-@dataclass(cmp=False)
-class ListModel(UserList, Sequence[T], BaseModel):
+def serialize(value: Any) -> Any:
+    """
+    Convert a non primitive field value for :meth:`BaseModel.to_dict`, models
+    are converted to dictionaries and collections to lists.
+
+    :param value: The field value
+    :rtype: Any
+    """
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if isinstance(value, (list, tuple, set)):
+        return [serialize(item) for item in value]
+    return value
+
+
+def compile_to_dict(cls: Type) -> Callable:
+    """
+    Generate a specialized to_dict function for the given model class. Primitive
+    fields are copied as they are and everything else goes through
+    :func:`serialize`, that way we avoid the reflection of `attr.asdict`.
+
+    :param cls: The model class
+    :rtype: Callable
+    """
+    lines = ["def to_dict(self):", "    result = {}"]
+    for f in fields(cls):
+        value = "value" if f.type in primitives else "serialize(value)"
+        lines.extend(
+            [
+                f"    value = self.{f.name}",
+                "    if value is not None and not isinstance(value, dict):",
+                f"        result[{f.name!r}] = {value}",
+            ]
+        )
+    lines.append("    return result")
+
+    namespace: Dict[str, Any] = {"serialize": serialize}
+    exec("\n".join(lines), namespace)  # nosec
+    return namespace["to_dict"]
+
+
+class SlottedModel(BaseModel):
+    """
+    Base for the small models that are created in large numbers, they use
+    slots instead of a per instance dictionary but keep a slot for the
+    :attr:`params`.
+    """
+
+    __slots__ = ("_params",)
+
+    @property  # type: ignore
+    def params(self) -> Union[List, Dict, None]:
+        return getattr(self, "_params", None)
+
+    @params.setter
+    def params(self, value: Union[List, Dict, None]):
+        self._params = value
+
+
+@dataclass(cmp=False, init=False, repr=False)
+class ListModel(List[T], BaseModel):
     """
     Wrap a list of :class:`~pydrag.models.common.BaseModel` objects with
     metadata.
@@ -92,7 +198,6 @@ class ListModel(UserList, Sequence[T], BaseModel):
     :param search_terms: Search query string
     """
 
-    data: List[T] = []
     page: Optional[int] = None
     limit: Optional[int] = None
     total: Optional[int] = None
@@ -106,6 +211,48 @@ class ListModel(UserList, Sequence[T], BaseModel):
     to_date: Optional[int] = None
     search_terms: Optional[str] = None
 
+    def __init__(self, data: Iterable[T] = (), **kwargs: Any):
+        super().__init__(data)
+        self.__attrs_init__(**kwargs)
+
+    def __repr__(self) -> str:
+        values = [f"data={list.__repr__(self)}"]
+        for f in fields(type(self)):
+            values.append(f"{f.name}={getattr(self, f.name)!r}")
+        return f"{type(self).__name__}({', '.join(values)})"
+
+    def __getitem__(self, index):
+        result = super().__getitem__(index)
+        if isinstance(index, slice):
+            return type(self)(result)
+        return result
+
+    @property
+    def data(self) -> List[T]:
+        """Backwards compatibility, the model is the list of objects itself."""
+        return self
+
+    @data.setter
+    def data(self, value: Iterable[T]):
+        self[:] = value
+
+    def to_dict(self) -> Dict:
+        result = super().to_dict()
+        result["data"] = [serialize(item) for item in self]
+        return result
+
+    def top(self, name: str, limit: int) -> List[T]:
+        """
+        Return the objects with the highest values for the given numeric
+        attribute, e.g. playcount, listeners or match. Missing values rank as
+        zero.
+
+        :param str name: The attribute name to rank by
+        :param int limit: The number of objects to return
+        :rtype: :class:`list` of :class:`~pydrag.models.common.BaseModel`
+        """
+        return heapq.nlargest(limit, self, key=lambda x: getattr(x, name) or 0)
+
     @classmethod
     def from_dict(cls: Type, data: Dict):
         if "attr" in data:
@@ -163,13 +310,18 @@ class Config:
     api_url: str = "https://ws.audioscrobbler.com/2.0/"
     auth_url: str = "https://www.last.fm/api/auth?token={}&api_key={}"
     _instance: Optional["Config"] = None
+    _auth_token: Optional[Tuple[Tuple, str]] = None
 
     def __attrs_post_init__(self):
         Config._instance = self
 
     @property
     def auth_token(self):
-        return md5(str(self.username) + str(self.password))
+        credentials = (self.username, self.password)
+        if self._auth_token is None or self._auth_token[0] != credentials:
+            token = md5(str(self.username) + str(self.password))
+            self._auth_token = (credentials, token)
+        return self._auth_token[1]
 
     @staticmethod
     def instance(
@@ -182,8 +334,8 @@ class Config:
         """Get/Create a config instance, if no api key is specified it attempt
         to read the settings from environmental variables."""
 
-        keys = [f.name for f in fields(Config)]
         if Config._instance is None or api_key:
+            keys = [f.name for f in fields(Config)]
             if api_key:
                 values = locals()
                 params = {k: values[k] for k in keys}
@@ -206,28 +358,38 @@ class Config:
         return asdict(self)
 
 
-@dataclass
-class Image(BaseModel):
+@dataclass(slots=True)
+class Image(SlottedModel):
     size: str
     text: str
 
+    @classmethod
+    def from_dict(cls, data: Dict):
+        # Every track, album and artist carries a few images and last.fm
+        # almost always sends them already shaped, skip the generic path
+        size = data.get("size")
+        text = data.get("text")
+        if len(data) == 2 and type(size) is str and type(text) is str:
+            return cls(size=size, text=text)
+        return super().from_dict(data)
 
-@dataclass
-class Chart(BaseModel):
+
+@dataclass(slots=True)
+class Chart(SlottedModel):
     text: str
     from_date: str
     to_date: str
 
 
-@dataclass
-class Link(BaseModel):
+@dataclass(slots=True)
+class Link(SlottedModel):
     href: str
     rel: str
     text: str
 
 
-@dataclass
-class Wiki(BaseModel):
+@dataclass(slots=True)
+class Wiki(SlottedModel):
     content: Optional[str] = None
     summary: Optional[str] = None
     published: Optional[str] = None
@@ -235,11 +397,13 @@ class Wiki(BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict):
-        if "links" in data:
-            if isinstance(data["links"]["link"], dict):
-                data["links"]["link"] = [data["links"]["link"]]
+        links = data.get("links")
+        if links is not None:
+            link = links["link"]
+            if isinstance(link, dict):
+                link = [link]
 
-            data["links"] = list(map(Link.from_dict, data["links"]["link"]))
+            data["links"] = list(map(Link.from_dict, link))
         return super().from_dict(data)
 
 
@@ -258,14 +422,14 @@ class ScrobbleTrack(BaseModel):
     chosen_by_user: Optional[bool] = None
 
     def to_api_dict(self):
-        return {to_camel_case(k): v for k, v in self.to_dict().items()}
+        return {scrobble_api_keys[k]: v for k, v in self.to_dict().items()}
 
     @classmethod
     def from_dict(cls, data: Dict):
-        data.update(
-            {
-                k: data[k]["text"] if data.get(k, {}).get("text", "") != "" else None
-                for k in ["album", "artist", "track", "album_artist"]
-            }
-        )
+        for key in ("album", "artist", "track", "album_artist"):
+            value = data.get(key)
+            data[key] = (value.get("text") or None) if value else None
         return super().from_dict(data)
+
+
+scrobble_api_keys = {f.name: to_camel_case(f.name) for f in fields(ScrobbleTrack)}
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 
@@ -11,10 +14,12 @@ from pydrag.models.common import BaseModel
 from pydrag.models.common import Image
 from pydrag.models.common import ListModel
 from pydrag.models.common import RawResponse
+from pydrag.models.common import scrobble_api_keys
 from pydrag.models.common import ScrobbleTrack
 from pydrag.models.common import Wiki
 from pydrag.models.tag import Tag
 from pydrag.services import ApiMixin
+from pydrag.utils import divide_chunks
 
 
 @dataclass
@@ -72,19 +77,15 @@ class Track(ApiMixin, BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict):
-        try:
-            correction = data.pop("correction")
-            data = correction.pop("track")
-        except KeyError:
-            pass
+        correction = data.pop("correction", None)
+        if correction and "track" in correction:
+            data = correction["track"]
 
-        if isinstance(data["artist"], str):
-            data["artist"] = {"name": data["artist"]}
-
-        data.update(
-            {"name": str(data["name"]), "artist": Artist.from_dict(data["artist"])}
-        )
+        artist = data["artist"]
+        if isinstance(artist, str):
+            artist = {"name": artist}
 
+        data["artist"] = Artist.from_dict(artist)
         if "image" in data:
             data["image"] = list(map(Image.from_dict, data["image"]))
         if "top_tags" in data:
@@ -368,7 +369,7 @@ class Track(ApiMixin, BaseModel):
 
     @classmethod
     def scrobble_tracks(
-        cls, tracks: List[ScrobbleTrack], batch_size=10
+        cls, tracks: Iterable[ScrobbleTrack], batch_size=10, workers=1
     ) -> ListModel[ScrobbleTrack]:
         """
         Split tracks into the desired batch size, with maximum size set to 50
@@ -377,19 +378,27 @@ class Track(ApiMixin, BaseModel):
 
         :param tracks: The tracks to scrobble
         :param batch_size: The number of tracks to submit per cycle
+        :param workers: The number of batches to submit concurrently
         :rtype: :class:`pydrag.models.common.ListModel` of
             :class:`~pydrag.models.common.ScrobbleTrack`
         """
-
-        def divide_chunks(items, n):
-            for i in range(0, len(items), n):
-                yield items[i : i + n]
+        batches = divide_chunks(tracks, min(batch_size, 50))
+        results: Iterable[ListModel[ScrobbleTrack]]
+        if workers > 1:
+            first = next(batches, None)
+            if first is not None:
+                # Authenticate once before the batches race for the session
+                cls.get_session()
+                batches = chain([first], batches)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(Track._scrobble, batches))
+        else:
+            results = map(Track._scrobble, batches)
 
         data: List[ScrobbleTrack] = []
         params = []
-        for batch in list(divide_chunks(tracks, min(batch_size, 50))):
-            res = Track._scrobble(batch)
-            data += res.data
+        for res in results:
+            data.extend(res)
             params.append(res.params)
 
         result = ListModel(data)
@@ -405,13 +414,12 @@ class Track(ApiMixin, BaseModel):
             :class:`~pydrag.models.common.ScrobbleTrack`
         """
         params = {"method": "track.scrobble"}
-        params.update(
-            {
-                f"{field}[{idx}]": value
-                for idx, track in enumerate(tracks)
-                for field, value in track.to_api_dict().items()
-            }
-        )
+        for idx, track in enumerate(tracks):
+            for name, key in scrobble_api_keys.items():
+                value = getattr(track, name)
+                if value is not None:
+                    params[f"{key}[{idx}]"] = value
+
         return cls.submit(
             bind=ScrobbleTrack,
             flatten="scrobble",
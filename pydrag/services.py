@@ -1,8 +1,12 @@
+import json
 from typing import Dict
 from typing import Optional
 from typing import Type
+from urllib.parse import urlencode
 
-from requests import request
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pydrag import utils
 from pydrag.exceptions import ApiError
@@ -10,9 +14,40 @@ from pydrag.models.common import BaseModel
 from pydrag.models.common import Config
 from pydrag.models.common import ListModel
 from pydrag.utils import get_nested
+from pydrag.utils import TTLCache
+
+
+def create_http_session() -> Session:
+    """
+    Create the http session shared by all the api calls, to reuse the
+    connections and retry the idempotent requests on server errors.
+
+    :rtype: :class:`requests.Session`
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class ApiMixin:
+    """
+    Last.fm api request layer.
+
+    Read only responses can be cached across all the models by setting a
+    time to live in seconds, e.g. ``ApiMixin.cache.ttl = 600``.
+    """
+
+    cache = TTLCache()
+    http_session = create_http_session()
+
     @classmethod
     def get_session(cls) -> "AuthSession":  # type: ignore
         """
@@ -34,6 +69,7 @@ class ApiMixin:
         bind: Type[BaseModel],
         flatten: Optional[str] = None,
         params: Optional[Dict] = None,
+        cache: bool = True,
     ):
         """
         Perform an api retrieve/get resource action.
@@ -42,6 +78,7 @@ class ApiMixin:
         :type bind: :class:`~pydrag.models.common.BaseModel`
         :param str flatten: A dot separated string used to flatten nested list of values
         :param Dict params: A dictionary of query string params
+        :param bool cache: Allow the response to be served from the cache
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
         return cls._perform(
@@ -52,6 +89,7 @@ class ApiMixin:
             sign=False,
             stateful=False,
             authenticate=False,
+            cache=cache,
         )
 
     @classmethod
@@ -96,6 +134,7 @@ class ApiMixin:
         sign: bool,
         stateful: bool,
         authenticate: bool,
+        cache: bool = False,
     ):
         """
         Orchestrate the request, error handling and response deserialization.
@@ -108,20 +147,40 @@ class ApiMixin:
         :param bool sign: Sign the request with the api secret
         :param bool stateful: Requires a session
         :param bool authenticate: Perform an authentication request
+        :param bool cache: Allow the response to be served from the cache
         :rtype: :class:`~pydrag.models.common.BaseModel`
         """
-        data: Dict = {}
+        data: Optional[str] = None
         query: Dict = {}
+        headers: Dict = {}
         if method == "GET":
             query = cls.prepare_params(params, sign, stateful, authenticate)
         else:
-            data = cls.prepare_params(params, sign, stateful, authenticate)
+            # Encode the body ourselves, requests would re-check every value
+            data = urlencode(cls.prepare_params(params, sign, stateful, authenticate))
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        key = tuple(sorted(query.items())) if cache and method == "GET" else None
+        cached: Optional[bytes] = cls.cache.get(key) if key else None
+        if cached is None:
+            cfg = Config.instance()
+            response = cls.http_session.request(
+                method=method,
+                url=cfg.api_url,
+                data=data,
+                params=query,
+                headers=headers,
+            )
+            response.raise_for_status()
+            content: bytes = response.content
+        else:
+            content = cached
 
-        cfg = Config.instance()
-        response = request(method=method, url=cfg.api_url, data=data, params=query)
-        response.raise_for_status()
-        body = response.json(object_pairs_hook=pythonic_variables)
+        body = json.loads(content, object_pairs_hook=pythonic_variables)
         cls.raise_for_error(body)
+        if key and cached is None:
+            cls.cache.set(key, content)
+
         obj = cls.bind_data(bind, body, flatten)
         obj.params = params
         return obj
@@ -222,53 +281,54 @@ class ApiMixin:
         return utils.md5("".join(signature))  # type: ignore
 
 
+_KEY_RENAMES = {
+    "albummatches": "albums",
+    "artistmatches": "artists",
+    "trackmatches": "tracks",
+    "startPage": "page",
+    "trackcorrected": "track_corrected",
+    "artistcorrected": "artist_corrected",
+    "to": "to_date",
+    "for": "user",
+    "from": "from_date",
+    "tagcount": "tag_count",
+    "@attr": "attr",
+    "#text": "text",
+    "unixtime": "timestamp",
+    "uts": "timestamp",
+    "searchTerms": "search_terms",
+    "opensearch:itemsPerPage": "limit",
+    "opensearch:totalResults": "total",
+    "toptags": "top_tags",
+    "streamId": "stream_id",
+    "albumArtist": "album_artist",
+    "realname": "real_name",
+    "recenttrack": "recent_track",
+    "ontour": "on_tour",
+    "num_res": "limit",
+    "title": "name",
+    "userloved": "loved",
+    "opensearch:Query": "query",
+    "perPage": "limit",
+    "position": "rank",
+}
+
+# A list of fields that dont make make sense in the api responses
+# Either they don't always have the same value type or have a dev message
+_IGNORED_KEYS = {
+    "subscriber",
+    "type",
+    "scrobblesource",
+    "bootstrap",
+    "streamable",
+    "ignoredMessage",
+    "totalPages",  # I can do the math
+    "opensearch:startIndex",  # I can do the math,
+    "ignored",
+    "accepted",
+    "role",
+}
+
+
 def pythonic_variables(data):
-    convert = {
-        "albummatches": "albums",
-        "artistmatches": "artists",
-        "trackmatches": "tracks",
-        "startPage": "page",
-        "trackcorrected": "track_corrected",
-        "artistcorrected": "artist_corrected",
-        "to": "to_date",
-        "for": "user",
-        "from": "from_date",
-        "tagcount": "tag_count",
-        "@attr": "attr",
-        "#text": "text",
-        "unixtime": "timestamp",
-        "uts": "timestamp",
-        "searchTerms": "search_terms",
-        "opensearch:itemsPerPage": "limit",
-        "opensearch:totalResults": "total",
-        "toptags": "top_tags",
-        "streamId": "stream_id",
-        "albumArtist": "album_artist",
-        "realname": "real_name",
-        "recenttrack": "recent_track",
-        "ontour": "on_tour",
-        "num_res": "limit",
-        "title": "name",
-        "userloved": "loved",
-        "opensearch:Query": "query",
-        "perPage": "limit",
-        "position": "rank",
-    }
-
-    # A list of fields that dont make make sense in the api responses
-    # Either they don't always have the same value type or have a dev message
-    fixme = [
-        "subscriber",
-        "type",
-        "scrobblesource",
-        "bootstrap",
-        "streamable",
-        "ignoredMessage",
-        "totalPages",  # I can do the math
-        "opensearch:startIndex",  # I can do the math,
-        "ignored",
-        "accepted",
-        "role",
-    ]
-
-    return {convert.get(k, k): v for k, v in data if k not in fixme}
+    return {_KEY_RENAMES.get(k, k): v for k, v in data if k not in _IGNORED_KEYS}
@@ -1,4 +1,13 @@
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
 
 
@@ -36,3 +45,84 @@ def get_nested(obj, keys, ensure_list=False):
     if ensure_list and isinstance(obj, dict):
         obj = [obj]
     return obj
+
+
+def divide_chunks(items: Iterable, n: int) -> Iterator[List]:
+    """
+    Split any iterable into lists of up to n items without copying slices
+    of the whole sequence.
+
+    :param items: The items to split
+    :param int n: The chunk size
+    :rtype: Iterator[List]
+    :raise: ValueError if the chunk size is less than one
+    """
+    if n < 1:
+        raise ValueError("Chunk size must be at least 1.")
+
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+class TTLCache:
+    """
+    Least recently used cache with a time to live for its entries.
+
+    :param int maxsize: The maximum number of entries to keep
+    :param float ttl: The seconds an entry is valid, zero disables the cache
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the cached value or None if the key is missing or expired.
+
+        :param key: The cache key
+        :rtype: Any
+        """
+        if self.ttl <= 0:
+            return None
+
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires < time.monotonic():
+                del self.data[key]
+                return None
+
+            self.data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value and evict the least recently used entries if the cache
+        is full.
+
+        :param key: The cache key
+        :param value: The value to store
+        """
+        if self.ttl <= 0:
+            return
+
+        with self.lock:
+            self.data[key] = (time.monotonic() + self.ttl, value)
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        """Remove all the cached entries."""
+        with self.lock:
+            self.data.clear()
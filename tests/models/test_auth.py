@@ -1,6 +1,9 @@
+from unittest import mock
+
 from pydrag import Config
 from pydrag.models.auth import AuthSession
 from pydrag.models.auth import AuthToken
+from pydrag.utils import TTLCache
 from tests import fixture
 from tests import MethodTestCase
 
@@ -43,3 +46,14 @@ class AuthTokenTests(MethodTestCase):
         auth_url = "https://www.last.fm/api/auth?token=CENSORED&api_key=abc"
         self.assertEqual(auth_url, result.auth_url)
         self.assertFixtureEqual("auth/get_token", result.to_dict())
+
+    @mock.patch.object(AuthToken, "cache", TTLCache(ttl=600))
+    def test_generate_is_never_cached(self):
+        with fixture.use_cassette(
+            path="auth/get_token", allow_playback_repeats=True
+        ) as cassette:
+            AuthToken.generate()
+            AuthToken.generate()
+
+        self.assertEqual(2, cassette.play_count)
+        self.assertEqual({}, AuthToken.cache.data)
@@ -2,12 +2,127 @@ import os
 from unittest import mock
 from unittest import TestCase
 
+from pydrag.models.common import BaseModel
 from pydrag.models.common import Config
+from pydrag.models.common import Image
+from pydrag.models.common import ListModel
 from pydrag.models.common import RawResponse
 from pydrag.models.common import ScrobbleTrack
 from pydrag.utils import md5
 
 
+class BaseModelTests(TestCase):
+    def test_primitive_fields(self):
+        result = ListModel.primitive_fields()
+        expected = (
+            ("tag", "user", "artist", "track", "album", "country", "search_terms"),
+            ("page", "limit", "total", "from_date", "to_date"),
+            (),
+            (),
+        )
+        self.assertEqual(expected, result)
+        self.assertIs(result, ListModel.primitive_fields())
+
+        expected = (
+            (
+                "artist",
+                "track",
+                "track_number",
+                "album",
+                "album_artist",
+                "mbid",
+                "context",
+                "stream_id",
+            ),
+            ("timestamp", "duration"),
+            (),
+            ("chosen_by_user",),
+        )
+        self.assertEqual(expected, ScrobbleTrack.primitive_fields())
+
+    def test_from_dict(self):
+        result = ListModel.from_dict(
+            dict(data=[], page="2", limit="a", total=None, album=1)
+        )
+        self.assertEqual(2, result.page)
+        self.assertEqual(0, result.limit)
+        self.assertIsNone(result.total)
+        self.assertEqual("1", result.album)
+
+    def test_to_dict(self):
+        result = ListModel(
+            data=[Image(size="small", text="a"), {"a": 1}, None], page=1, user={}
+        )
+        expected = {
+            "data": [{"size": "small", "text": "a"}, {"a": 1}, None],
+            "page": 1,
+        }
+        self.assertEqual(expected, result.to_dict())
+        self.assertIn("_to_dict", ListModel.__dict__)
+        self.assertNotIn("_to_dict", BaseModel.__dict__)
+
+    def test_slotted_model_params(self):
+        image = Image(size="small", text="a")
+        self.assertFalse(hasattr(image, "__dict__"))
+        self.assertIsNone(image.params)
+
+        image.params = {"a": 1}
+        self.assertEqual({"a": 1}, image.params)
+        self.assertEqual({"size": "small", "text": "a"}, image.to_dict())
+
+
+class ImageTests(TestCase):
+    def test_from_dict(self):
+        image = Image.from_dict(dict(size="small", text="a"))
+        self.assertEqual(Image(size="small", text="a"), image)
+
+        image = Image.from_dict(dict(size=1, text="a"))
+        self.assertEqual(Image(size="1", text="a"), image)
+
+        with self.assertRaises(TypeError):
+            Image.from_dict(dict(size="small", text="a", foo="bar"))
+
+
+class ListModelTests(TestCase):
+    def test_repr(self):
+        result = ListModel([Image(size="small", text="a")], page=1)
+        expected = (
+            "ListModel(data=[Image(size='small', text='a')], page=1, limit=None, "
+            "total=None, tag=None, user=None, artist=None, track=None, album=None, "
+            "country=None, from_date=None, to_date=None, search_terms=None)"
+        )
+        self.assertEqual(expected, repr(result))
+
+    def test_slice(self):
+        images = [Image(size=str(i), text="a") for i in range(3)]
+        result = ListModel(images, page=1)
+
+        self.assertIs(images[0], result[0])
+        self.assertIsInstance(result[1:], ListModel)
+        self.assertEqual(images[1:], result[1:])
+
+    def test_data(self):
+        images = [Image(size=str(i), text="a") for i in range(3)]
+        result = ListModel(images[:1])
+        self.assertIs(result, result.data)
+
+        result.data = images
+        self.assertEqual(images, result)
+
+    def test_top(self):
+        tracks = [
+            ScrobbleTrack(artist="a", track="a", duration=3),
+            ScrobbleTrack(artist="b", track="b", duration=None),
+            ScrobbleTrack(artist="c", track="c", duration=7),
+            ScrobbleTrack(artist="d", track="d", duration=5),
+        ]
+        result = ListModel(tracks)
+
+        self.assertEqual([tracks[2], tracks[3]], result.top("duration", 2))
+        self.assertEqual(tracks[1], result.top("duration", 10)[-1])
+        self.assertEqual([], result.top("duration", 0))
+
+
 class RawResponseTests(TestCase):
     def test_to_dict(self):
         raw = RawResponse.from_dict(dict(a=1))
@@ -142,6 +257,14 @@ class ConfigTests(TestCase):
 
         self.assertDictEqual(expected, Config.instance().to_dict())
 
+    def test_auth_token(self):
+        config = Config.instance("key", username="foo", password="bar")
+        self.assertEqual(md5("foo" + md5("bar")), config.auth_token)
+        self.assertIs(config.auth_token, config.auth_token)
+
+        config.username = "thug"
+        self.assertEqual(md5("thug" + md5("bar")), config.auth_token)
+
     def test_instance_raises_exception(self):
         with self.assertRaises(ValueError) as cm:
             Config.instance()
@@ -10,6 +10,7 @@ from pydrag.models.common import ListModel
 from pydrag.models.common import RawResponse
 from pydrag.models.common import ScrobbleTrack
 from pydrag.models.track import Track
+from pydrag.utils import TTLCache
 from tests import fixture
 from tests import MethodTestCase
 
@@ -83,6 +84,16 @@ class TrackTests(MethodTestCase):
         self.assertIsInstance(result, Track)
         self.assertFixtureEqual("track/find", result.to_dict())
 
+    @mock.patch.object(Track, "cache", TTLCache(ttl=60))
+    def test_find_with_cache(self):
+        with fixture.use_cassette(path="track/find") as cassette:
+            first = Track.find(artist="AC / DC", track="Hells Bell")
+            second = Track.find(artist="AC / DC", track="Hells Bell")
+
+        self.assertEqual(1, cassette.play_count)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.to_dict(), second.to_dict())
+
     @fixture.use_cassette(path="track/find_by_mbid")
     def test_find_by_mbid(self):
         result = Track.find_by_mbid(
@@ -285,6 +296,34 @@ class TrackTests(MethodTestCase):
         self.assertEqual(expected_params, result.params)
         self.assertFixtureEqual("track/scrobble_tracks", result.to_dict())
 
+    @mock.patch.object(Track, "get_session")
+    @mock.patch.object(Track, "_scrobble")
+    def test_scrobble_tracks_with_workers(self, scrobble, get_session):
+        def submit(batch):
+            result = ListModel(batch)
+            result.params = [track.artist for track in batch]
+            return result
+
+        scrobble.side_effect = submit
+        tracks = [ScrobbleTrack(artist=str(i), track="Sail") for i in range(5)]
+
+        result = Track.scrobble_tracks(tracks, batch_size=2, workers=3)
+
+        self.assertEqual(1, get_session.call_count)
+        self.assertEqual(3, scrobble.call_count)
+        self.assertEqual(tracks, result.data)
+        self.assertEqual([["0", "1"], ["2", "3"], ["4"]], result.params)
+
+    @mock.patch.object(Track, "get_session")
+    @mock.patch.object(Track, "_scrobble")
+    def test_scrobble_tracks_with_workers_and_no_tracks(self, scrobble, get_session):
+        result = Track.scrobble_tracks([], workers=3)
+
+        self.assertEqual(0, get_session.call_count)
+        self.assertEqual(0, scrobble.call_count)
+        self.assertEqual([], result)
+        self.assertEqual([], result.params)
+
     @fixture.use_cassette(path="geo/get_top_tracks")
     def test_get_top_tracks_by_country(self):
         result = Track.get_top_tracks_by_country(country="greece", page=1, limit=10)
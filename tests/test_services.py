@@ -0,0 +1,66 @@
+import json
+from unittest import mock
+from unittest import TestCase
+
+from pydrag.models.common import Config
+from pydrag.models.common import RawResponse
+from pydrag.services import ApiMixin
+from pydrag.services import pythonic_variables
+from pydrag.utils import md5
+
+
+class ServicesTests(TestCase):
+    content = (
+        b'{"toptracks": {"track": [{"name": "\xe2\x99\xa5", "@attr": {"rank": "1"},'
+        b' "streamable": {"#text": "0"}}], "@attr": {"perPage": "1"}}}'
+    )
+    expected = {
+        "toptracks": {
+            "track": [{"name": "♥", "attr": {"rank": "1"}}],
+            "attr": {"limit": "1"},
+        }
+    }
+
+    def test_pythonic_variables(self):
+        actual = json.loads(self.content, object_pairs_hook=pythonic_variables)
+        self.assertEqual(self.expected, actual)
+
+    @mock.patch.object(Config, "instance")
+    def test_sign(self, instance):
+        instance.return_value.api_secret = "secret"
+        params = {"method": "track.love", "format": "json", "sk": "", "api_key": "a"}
+
+        expected = md5("api_keyamethodtrack.lovesecret")
+        self.assertEqual(expected, ApiMixin.sign(params))
+
+        instance.return_value.api_secret = "other"
+        self.assertNotEqual(expected, ApiMixin.sign(params))
+
+    @mock.patch.object(ApiMixin.http_session, "request")
+    @mock.patch.object(Config, "instance")
+    def test_submit_encodes_body(self, instance, request):
+        instance.return_value.api_key = "key"
+        instance.return_value.api_secret = "secret"
+        instance.return_value.session.key = "sk"
+        request.return_value.content = b"{}"
+
+        result = ApiMixin.submit(
+            bind=RawResponse,
+            stateful=True,
+            params={"method": "track.love", "artist": "AC / DC", "track": "A & B"},
+        )
+
+        signature = md5(
+            "api_keykeyartistAC / DCmethodtrack.lovesksktrackA & Bsecret"
+        )
+        request.assert_called_once_with(
+            method="POST",
+            url=instance.return_value.api_url,
+            data=(
+                "method=track.love&artist=AC+%2F+DC&track=A+%26+B"
+                f"&format=json&api_key=key&sk=sk&api_sig={signature}"
+            ),
+            params={},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        self.assertIsInstance(result, RawResponse)
@@ -1,7 +1,10 @@
+from unittest import mock
 from unittest import TestCase
 
+from pydrag.utils import divide_chunks
 from pydrag.utils import md5
 from pydrag.utils import to_camel_case
+from pydrag.utils import TTLCache
 
 
 class UtilTests(TestCase):
@@ -11,9 +14,47 @@ class UtilTests(TestCase):
         self.assertEqual("", md5(""))
         self.assertIsNone(md5(None))
 
+    def test_divide_chunks(self):
+        self.assertEqual([[0, 1], [2, 3], [4]], list(divide_chunks(range(5), 2)))
+        self.assertEqual([[0, 1]], list(divide_chunks(iter([0, 1]), 5)))
+        self.assertEqual([], list(divide_chunks([], 2)))
+
+        with self.assertRaises(ValueError) as cm:
+            list(divide_chunks([1], 0))
+        self.assertEqual("Chunk size must be at least 1.", str(cm.exception))
+
     def test_to_camel_case(self):
         self.assertEqual("aaBb", to_camel_case("aa_bb"))
         self.assertEqual("aaBb", to_camel_case("aA_bB"))
         self.assertEqual("aaBb", to_camel_case("AA_BB"))
         self.assertEqual("aa", to_camel_case("aa"))
         self.assertEqual("aa", to_camel_case("Aa"))
+
+
+class TTLCacheTests(TestCase):
+    def test_disabled(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_maxsize(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.set("c", 3)
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(3, cache.get("c"))
+
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+
+    @mock.patch("pydrag.utils.time.monotonic")
+    def test_ttl(self, monotonic):
+        monotonic.side_effect = [100, 105, 111]
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual({}, cache.data)